@@ -0,0 +1,81 @@
+from dataclasses import asdict
+
+import pytest
+from icalendar import Calendar
+
+from utils import _parse_ics, parse_ics_parallel
+
+VTIMEZONE = "\r\n".join(
+    [
+        "BEGIN:VTIMEZONE",
+        "TZID:Europe/Berlin",
+        "BEGIN:STANDARD",
+        "DTSTART:19701025T030000",
+        "TZOFFSETFROM:+0200",
+        "TZOFFSETTO:+0100",
+        "RRULE:FREQ=YEARLY;BYMONTH=10;BYDAY=-1SU",
+        "END:STANDARD",
+        "END:VTIMEZONE",
+    ]
+)
+
+
+def vevent(i: int, description: str = "", extra: str = "") -> str:
+    lines = [
+        "BEGIN:VEVENT",
+        f"UID:event-{i}@example.com",
+        f"SUMMARY:Event {i}",
+        f"LOCATION:Room {i}",
+        f"DTSTART;TZID=Europe/Berlin:20240101T{i % 24:02d}0000",
+        f"DTEND;TZID=Europe/Berlin:20240101T{i % 24:02d}3000",
+        "LAST-MODIFIED:20231201T120000Z",
+        f"SEQUENCE:{i % 3}",
+        f"DESCRIPTION:{description or f'Description {i}'}",
+    ]
+    if extra:
+        lines.append(extra)
+    lines.append("END:VEVENT")
+    return "\r\n".join(lines)
+
+
+def feed(events, newline: str = "\r\n", tz: bool = True) -> str:
+    lines = ["BEGIN:VCALENDAR", "VERSION:2.0", "PRODID:-//test//EN"]
+    if tz:
+        lines.append(VTIMEZONE)
+    lines += list(events)
+    lines.append("END:VCALENDAR")
+    return (newline.join(lines) + newline).replace("\r\n", newline)
+
+
+def serial(text: str):
+    return [asdict(e) for e in _parse_ics(Calendar.from_ical(text))]
+
+
+FEEDS = [
+    # Plain feed, larger than the chunk size
+    feed(vevent(i) for i in range(25)),
+    # Empty feed
+    feed([]),
+    # LF only line endings and no VTIMEZONE
+    feed((vevent(i) for i in range(7)), newline="\n", tz=False),
+    # Alarms nested inside events
+    feed(
+        vevent(i, extra="BEGIN:VALARM\r\nACTION:DISPLAY\r\nTRIGGER:-PT15M\r\nEND:VALARM")
+        for i in range(5)
+    ),
+    # Folded line whose continuation reads like an event boundary
+    feed(vevent(i, description="folded\r\n END:VEVENT") for i in range(3)),
+    # Characters that str.splitlines() treats as line breaks
+    feed(vevent(i, description="line one\u2028line two\x85three\x0cfour") for i in range(3)),
+    # Lowercase component names
+    feed(vevent(i).replace("BEGIN:VEVENT", "begin:vevent") for i in range(4)),
+]
+
+
+@pytest.mark.parametrize("max_workers", [1, None, 2])
+def test_parse_ics_parallel_matches_serial(max_workers):
+    parsed = parse_ics_parallel(FEEDS, max_workers=max_workers, chunk_size=2)
+
+    assert len(parsed) == len(FEEDS)
+    for text, events in zip(FEEDS, parsed):
+        assert [asdict(e) for e in events] == serial(text)
@@ -1,3 +1,4 @@
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass
 from functools import cached_property
 import re
@@ -266,7 +267,7 @@ class Event:
                 event["end"] = get_utc_time(prop.dt)
 
             elif name == "SEQUENCE":
-                event["sequence"] = prop
+                event["sequence"] = int(prop)
 
             elif name == "TRANSP":
                 event["transparency"] = prop.lower()
@@ -373,6 +374,80 @@ def _parse_ics(calendar: Calendar) -> List[Event]:
     return events
 
 
+def _parse_ics_text(text: str) -> List[Event]:
+    # Runs in a worker process, so it has to stay a module level function
+    return _parse_ics(Calendar.from_ical(text))
+
+
+def _split_ics(text: str, chunk_size: int) -> List[str]:
+    """
+    Split an ICS feed at VEVENT boundaries into standalone calendars of at
+    most `chunk_size` events each. Every chunk keeps the non-event lines of
+    the feed (VCALENDAR properties, VTIMEZONEs, ...) so it parses on its own.
+    """
+
+    def is_line(line: str, name: str) -> bool:
+        # Folded continuation lines start with a space or tab and are never
+        # boundaries, even if their text reads like one
+        return line[:1] not in (" ", "\t") and line.rstrip().upper() == name
+
+    header, footer, vevents = [], [], []
+    current = None
+    # Only CRLF / LF are line breaks in ICS, str.splitlines() would also
+    # split on characters that are valid inside TEXT values
+    for line in re.split(r"\r?\n", text):
+        if current is not None:
+            current.append(line)
+            if is_line(line, "END:VEVENT"):
+                vevents.append("\r\n".join(current))
+                current = None
+        elif is_line(line, "BEGIN:VEVENT"):
+            current = [line]
+        elif is_line(line, "END:VCALENDAR"):
+            footer.append(line)
+        elif line:
+            header.append(line)
+
+    if len(vevents) <= chunk_size:
+        return [text]
+
+    header, footer = "\r\n".join(header), "\r\n".join(footer)
+    return [
+        "\r\n".join([header, *vevents[i : i + chunk_size], footer]) + "\r\n"
+        for i in range(0, len(vevents), chunk_size)
+    ]
+
+
+def parse_ics_parallel(
+    texts: List[str], max_workers: Optional[int] = None, chunk_size: int = 250
+) -> List[List[Event]]:
+    """
+    Parse several ICS feeds on a process pool.
+
+    Large feeds are split into chunks of `chunk_size` events so a single huge
+    feed is spread over all workers too. Returns one list of events per feed,
+    in the order of `texts`, with events in their original feed order.
+    """
+    chunks, owners = [], []
+    for i, text in enumerate(texts):
+        for chunk in _split_ics(text, chunk_size):
+            chunks.append(chunk)
+            owners.append(i)
+
+    results = [[] for _ in texts]
+    if len(chunks) <= 1 or max_workers == 1:
+        parsed = map(_parse_ics_text, chunks)
+        for owner, events in zip(owners, parsed):
+            results[owner].extend(events)
+        return results
+
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        # map keeps the submission order, so chunks come back in feed order
+        for owner, events in zip(owners, executor.map(_parse_ics_text, chunks)):
+            results[owner].extend(events)
+    return results
+
+
 @dataclass
 class InternalCalendar:
     account: "Account"
@@ -564,11 +639,33 @@ class ExternalCalendar:
     def from_url(url: str):
         return ExternalCalendar(url=url)
 
+    @cached_property
+    def text(self) -> str:
+        return requests.get(self.url).text
+
     @cached_property
     def calendar(self) -> Calendar:
         # Construct Calendar from url and get events
-        gcal = Calendar.from_ical(requests.get(self.url).text)
+        gcal = Calendar.from_ical(self.text)
         return gcal
 
-    def events(self):
+    def events(self, parallel: bool = False, max_workers: Optional[int] = None):
+        if parallel:
+            return ExternalCalendar.events_many([self], max_workers=max_workers)[0]
         return EventsList(_parse_ics(self.calendar))
+
+    @staticmethod
+    def events_many(
+        calendars: List["ExternalCalendar"], max_workers: Optional[int] = None
+    ) -> List[EventsList]:
+        """
+        Parse the events of several external calendars on a process pool.
+        Returns one EventsList per calendar, in the same order.
+
+        On macOS and Windows the workers are started with "spawn", which
+        re-imports the main module. Scripts using this (or
+        `events(parallel=True)`) must keep their module level code behind an
+        `if __name__ == "__main__":` guard, or every worker re-runs the sync.
+        """
+        parsed = parse_ics_parallel([c.text for c in calendars], max_workers)
+        return [EventsList(events) for events in parsed]